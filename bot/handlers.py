@@ -1,4 +1,3 @@
-import telebot
 import logging
 from functools import wraps
 
@@ -2,7 +2,6 @@ import os
 import logging
 import requests
 import datetime
-from bs4 import BeautifulSoup
 import time
 
 from bot.utils.summarizer import GeminiPDFSummarizer, SummarizationError
@@ -10,14 +9,20 @@ from bot.storage import JsonbinStorage
 
 logger = logging.getLogger(__name__)
 
+# Telegram Bot API limit for documents uploaded by a bot
+TELEGRAM_MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+
 class NoticeProcessor:
-    def __init__(self, summarizer: GeminiPDFSummarizer, storage: JsonbinStorage, neet_website_url: str):
+    def __init__(self, summarizer: GeminiPDFSummarizer, storage: JsonbinStorage, neet_website_url: str, send_pdf_attachment: bool = False):
         self.summarizer = summarizer
         self.storage = storage
         self.neet_website_url = neet_website_url
+        self.send_pdf_attachment = send_pdf_attachment
         os.makedirs('data/temp', exist_ok=True)
 
     def scrape_notices(self, max_retries=3):
+        from bs4 import BeautifulSoup
+
         for attempt in range(max_retries):
             try:
                 response = requests.get(self.neet_website_url, timeout=30)
@@ -109,7 +114,58 @@ class NoticeProcessor:
 
         return None
 
-    def send_telegram_alerts(self, bot, notice, summary, user_ids):
+    def send_pdf_document(self, bot, user_id, notice, caption, pdf_path, file_id=None):
+        # Upload from pdf_path only until Telegram hands back a file_id; reuse it for everyone after that
+        if file_id:
+            bot.send_document(user_id, file_id, caption=caption)
+            return file_id
+
+        file_name = os.path.basename(notice['link'].split('?')[0]) or 'notice.pdf'
+        with open(pdf_path, 'rb') as f:
+            sent_message = bot.send_document(user_id, f, caption=caption, visible_file_name=file_name)
+        logger.info(f"Uploaded PDF for notice '{notice['title']}' to Telegram")
+        return sent_message.document.file_id
+
+    @staticmethod
+    def is_recipient_error(error):
+        # Errors tied to a single chat (bot blocked, chat gone); anything else would repeat for every user
+        error_code = getattr(error, 'error_code', None)
+        description = str(getattr(error, 'description', error)).lower()
+        return error_code == 403 or (error_code == 400 and 'chat not found' in description)
+
+    @staticmethod
+    def is_transient_error(error):
+        # Rate limits, Telegram server errors and network failures hit one message, not the file itself
+        if isinstance(error, requests.exceptions.RequestException):
+            return True
+        error_code = getattr(error, 'error_code', None)
+        return error_code == 429 or (isinstance(error_code, int) and error_code >= 500)
+
+    @staticmethod
+    def get_retry_after(error, default=1, max_wait=30):
+        result_json = getattr(error, 'result_json', None) or {}
+        retry_after = result_json.get('parameters', {}).get('retry_after', default)
+        return min(retry_after, max_wait)
+
+    def send_pdf_with_retry(self, bot, user_id, notice, caption, pdf_path, file_id=None):
+        try:
+            return self.send_pdf_document(bot, user_id, notice, caption, pdf_path, file_id)
+        except Exception as e:
+            if not self.is_transient_error(e):
+                raise
+            retry_after = self.get_retry_after(e)
+            logger.warning(f"Transient PDF attachment send error to user {user_id}, retrying in {retry_after}s: {e}")
+            time.sleep(retry_after)
+            return self.send_pdf_document(bot, user_id, notice, caption, pdf_path, file_id)
+
+    def send_telegram_alerts(self, bot, notice, summary, user_ids, pdf_path=None):
+        file_id = None
+        attach_pdf = self.send_pdf_attachment and pdf_path
+
+        if attach_pdf and os.path.getsize(pdf_path) > TELEGRAM_MAX_UPLOAD_BYTES:
+            logger.warning(f"PDF for notice '{notice['title']}' exceeds Telegram's upload limit, sending link only")
+            attach_pdf = False
+
         for user_id in user_ids:
             try:
                 alert_message = f"""
@@ -117,7 +173,22 @@ class NoticeProcessor:
 Title: {notice['title']}
 PDF Link: {notice['link']}
                 """
-                bot.send_message(user_id, alert_message)
+                if attach_pdf:
+                    try:
+                        file_id = self.send_pdf_with_retry(bot, user_id, notice, alert_message, pdf_path, file_id)
+                    except Exception as e:
+                        if self.is_recipient_error(e):
+                            # The link and summary would fail the same way for this chat
+                            logger.error(f"PDF attachment send error to user {user_id}, skipping user: {e}")
+                            continue
+                        logger.error(f"PDF attachment send error to user {user_id}, falling back to link: {e}")
+                        if file_id is None and not self.is_transient_error(e):
+                            # The upload itself was rejected, so retrying it for everyone else would fail the same way
+                            logger.warning("Disabling PDF attachment for the remaining users of this notice")
+                            attach_pdf = False
+                        bot.send_message(user_id, alert_message)
+                else:
+                    bot.send_message(user_id, alert_message)
 
                 if summary:
                     summary_message = f"""
@@ -129,6 +200,8 @@ PDF Link: {notice['link']}
             except Exception as e:
                 logger.error(f"Telegram message send error to user {user_id}: {e}")
 
+        return file_id
+
     def process_new_notices(self, bot):
         try:
             logger.info("Checking for new notices")
@@ -163,9 +236,10 @@ PDF Link: {notice['link']}
 
                     if added_record:
                         logger.info("Sending alerts to users")
-                        self.send_telegram_alerts(bot, notice, summary, all_users)
-                        # Update status to 'Sent' after successfully sending alerts
-                        self.storage.update_notice_status(added_record['id'], 'Sent')
+                        file_id = self.send_telegram_alerts(bot, notice, summary, all_users, pdf_path)
+                        # Update status to 'Sent' after successfully sending alerts, caching the
+                        # Telegram file_id on the record in the same write
+                        self.storage.update_notice_status(added_record['id'], 'Sent', file_id)
                         logger.info("Notice processed successfully")
                     else:
                         logger.warning(f"Notice '{notice['title']}' was not added to Supabase, skipping alerts.")
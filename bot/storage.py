@@ -27,9 +27,7 @@ class JsonbinStorage:
         self.cache = None
         self.cache_time = None
         self.cache_ttl = timedelta(minutes=5)
-        
-        # Initial fetch to verify connection
-        self._fetch_data()
+        # Data is fetched lazily on first access so startup does not block on JSONBin
 
     def _fetch_data(self):
         if self.cache is not None and (datetime.now() - self.cache_time < self.cache_ttl):
@@ -126,7 +124,8 @@ class JsonbinStorage:
             'link': notice_data.get('link'),
             'date': notice_data.get('date'),
             'summary': notice_data.get('summary', ''),
-            'status': notice_data.get('status', 'New')
+            'status': notice_data.get('status', 'New'),
+            'file_id': notice_data.get('file_id')
         }
         
         data['notices'].append(new_notice)
@@ -148,12 +147,14 @@ class JsonbinStorage:
         data = self._fetch_data()
         return {notice.get('link') for notice in data.get('notices', []) if 'link' in notice}
 
-    def update_notice_status(self, record_id, status):
+    def update_notice_status(self, record_id, status, file_id=None):
         data = self._fetch_data()
         updated = False
         for notice in data.get('notices', []):
             if notice.get('id') == record_id:
                 notice['status'] = status
+                if file_id:
+                    notice['file_id'] = file_id
                 updated = True
                 break
         
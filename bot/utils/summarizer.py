@@ -1,6 +1,4 @@
 import os
-from google import genai
-from google.genai import types
 import logging
 import time
 
@@ -16,9 +14,22 @@ class GeminiPDFSummarizer:
         Args:
             api_key (str): Google Gemini API key
         """
-        # Initialize Gemini Client
-        self.client = genai.Client(api_key=api_key)
+        self.api_key = api_key
         self.model = 'gemini-3.5-flash'
+        self._client = None
+
+    @property
+    def client(self):
+        """
+        Gemini client, created on first use
+
+        google.genai is slow to import, so it is only loaded once a PDF
+        actually needs summarizing rather than at bot startup.
+        """
+        if self._client is None:
+            from google import genai
+            self._client = genai.Client(api_key=self.api_key)
+        return self._client
 
     def summarize_pdf(self, pdf_path):
         """
@@ -42,6 +53,8 @@ class GeminiPDFSummarizer:
             """
 
             try:
+                from google.genai import types
+
                 logging.info(f"Reading PDF {pdf_path} for inline Gemini summarization...")
                 with open(pdf_path, "rb") as f:
                     pdf_bytes = f.read()
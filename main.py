@@ -1,19 +1,25 @@
+import time
+
+# Taken before any other import so the startup report includes import cost
+PROCESS_START = time.perf_counter()
+
 import os
 import random
 import logging
-import telebot
 import schedule
-import time
+from contextlib import contextmanager
 from dotenv import load_dotenv
-from flask import Flask, jsonify
 import threading
 
-# Import modular components
+# Import modular components. Heavy third-party libraries (telebot, Flask,
+# google.genai, bs4) are imported lazily where they are first used.
 from bot.storage import JsonbinStorage
 from bot.handlers import BotHandlers
 from bot.notice_processor import NoticeProcessor
 from bot.utils.summarizer import GeminiPDFSummarizer
 
+IMPORTS_DONE = time.perf_counter()
+
 # Configure logging
 import sys
 
@@ -31,74 +37,157 @@ load_dotenv()
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 NEET_WEBSITE_URL = os.getenv('NEET_WEBSITE_URL', 'https://neet.nta.nic.in/')
+SEND_PDF_ATTACHMENT = os.getenv('SEND_PDF_ATTACHMENT', 'false').lower() in ('1', 'true', 'yes')
 
 # Ensure data directory exists
 os.makedirs('data', exist_ok=True)
 os.makedirs('data/temp', exist_ok=True)
 
+class StartupTimer:
+    """Records how long each startup phase takes and logs a summary"""
+    def __init__(self, start_time):
+        self.start_time = start_time
+        self.phases = []
+
+    def record(self, name, elapsed):
+        self.phases.append((name, elapsed))
+        logger.info(f"Startup phase '{name}' took {elapsed:.3f}s")
+
+    @contextmanager
+    def phase(self, name):
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - phase_start)
+
+    def report(self):
+        total = time.perf_counter() - self.start_time
+        lines = [f"  {name}: {elapsed:.3f}s" for name, elapsed in self.phases]
+        logger.info("Startup timing report:\n" + "\n".join(lines) + f"\n  total: {total:.3f}s")
+
 class NEETNoticeBot:
     def __init__(self):
-        self.bot = telebot.TeleBot(TELEGRAM_BOT_TOKEN)
-        self.storage = JsonbinStorage()
-        self.summarizer = GeminiPDFSummarizer(GEMINI_API_KEY)
-        self.notice_processor = NoticeProcessor(self.summarizer, self.storage, NEET_WEBSITE_URL)
-        self.handlers = BotHandlers(self.bot, self.storage)
+        self.timer = StartupTimer(PROCESS_START)
+        self.timer.record('module imports', IMPORTS_DONE - PROCESS_START)
+        self.health_ready = threading.Event()
+        self.polling_ready = threading.Event()
+        self.bot = None
+        self.storage = None
+        self.summarizer = None
+        self.notice_processor = None
+        self.handlers = None
+
+    def init_components(self):
+        with self.timer.phase('telegram client'):
+            import telebot
+            self.bot = telebot.TeleBot(TELEGRAM_BOT_TOKEN)
+        with self.timer.phase('storage'):
+            self.storage = JsonbinStorage()
+        with self.timer.phase('summarizer'):
+            self.summarizer = GeminiPDFSummarizer(GEMINI_API_KEY)
+        with self.timer.phase('notice processor'):
+            self.notice_processor = NoticeProcessor(self.summarizer, self.storage, NEET_WEBSITE_URL, SEND_PDF_ATTACHMENT)
+        with self.timer.phase('handlers'):
+            self.handlers = BotHandlers(self.bot, self.storage)
 
     def reset_webhook(self):
         """Reset any existing webhook to ensure clean polling"""
         try:
+            # deleteWebhook is synchronous, so polling can start as soon as it returns
             self.bot.delete_webhook()
-            time.sleep(0.5)  # Wait for webhook deletion to complete
             logger.info("Webhook reset successful")
         except Exception as e:
             logger.error(f"Error resetting webhook: {e}")
 
+    def start_polling(self):
+        """Reset the webhook and start long polling (runs in its own thread)"""
+        with self.timer.phase('webhook reset'):
+            self.reset_webhook()
+        self.polling_ready.set()
+        self.bot.polling(none_stop=True, timeout=30, long_polling_timeout=90)
+
+    def run_health_check_server(self):
+        """Serve /health (runs in its own thread)"""
+        with self.timer.phase('health server'):
+            from flask import Flask, jsonify
+            from werkzeug.serving import make_server
+
+            app = Flask(__name__)
+
+            @app.route('/health', methods=['GET'])
+            def health_check():
+                return jsonify({'status': 'ok'}), 200
+
+            PORT = int(os.getenv('HEALTH_CHECK_PORT', 8001))
+            # Use a production-ready WSGI server like waitress or gunicorn
+            # For simplicity, we'll use Flask's built-in server here,
+            # but it's not recommended for production.
+            # make_server binds the port immediately, so readiness can be signalled before serving.
+            # threaded=True matches app.run's default so a stalled connection cannot block health probes.
+            server = make_server('0.0.0.0', PORT, app, threaded=True)
+        self.health_ready.set()
+        server.serve_forever()
+
+    def wait_until_ready(self, timeout=60):
+        """Block until the health server and polling are up, then log the startup report"""
+        for name, event in (('health server', self.health_ready), ('polling', self.polling_ready)):
+            if not event.wait(timeout):
+                logger.warning(f"{name} not ready after {timeout} seconds")
+        self.timer.report()
+
     def run(self):
-        def scheduled_job():
-            try:
-                self.notice_processor.process_new_notices(self.bot)
-            except Exception as e:
-                logger.error(f"Error in scheduled job: {e}")
-            
+        # The schedule module is not thread-safe, so every scheduler change happens on the main thread
+        def schedule_next_check():
             next_interval = random.randint(300, 480)  # 5-8 minutes
             schedule.clear('notice_check')
             schedule.every(next_interval).seconds.do(scheduled_job).tag('notice_check')
             logger.info(f"Next check scheduled in {next_interval} seconds")
 
-        try:
-            self.reset_webhook()
-            
+        def check_notices():
+            try:
+                self.notice_processor.process_new_notices(self.bot)
+            except Exception as e:
+                logger.error(f"Error in scheduled job: {e}")
+
+        def scheduled_job():
+            check_notices()
+            schedule_next_check()
+
+        def initial_check():
             logger.info("Starting initial notice check")
-            scheduled_job()
+            check_start = time.perf_counter()
+            check_notices()
+            logger.info(f"Initial notice check finished in {time.perf_counter() - check_start:.3f}s")
+
+        try:
+            # Start the health check server first so the container reports healthy early
+            health_check_thread = threading.Thread(target=self.run_health_check_server)
+            health_check_thread.daemon = True
+            health_check_thread.start()
+            logger.info("Health check server starting in separate thread")
+
+            self.init_components()
 
             # Start Telegram bot polling in a separate thread
-            polling_thread = threading.Thread(target=self.bot.polling, kwargs={'none_stop': True, 'timeout': 30, 'long_polling_timeout': 90})
+            polling_thread = threading.Thread(target=self.start_polling)
             polling_thread.daemon = True
             polling_thread.start()
-            logger.info("Bot polling started in separate thread")
-
-            # Start a simple HTTP server for health checks in a separate thread
-            def run_health_check_server():
-                app = Flask(__name__)
+            logger.info("Bot polling starting in separate thread")
 
-                @app.route('/health', methods=['GET'])
-                def health_check():
-                    return jsonify({'status': 'ok'}), 200
-
-                PORT = int(os.getenv('HEALTH_CHECK_PORT', 8001))
-                # Use a production-ready WSGI server like waitress or gunicorn
-                # For simplicity, we'll use Flask's built-in server here,
-                # but it's not recommended for production.
-                app.run(host='0.0.0.0', port=PORT)
-
-            health_check_thread = threading.Thread(target=run_health_check_server)
-            health_check_thread.daemon = True
-            health_check_thread.start()
-            logger.info("Health check server started in separate thread")
+            # Run the first scrape/summarize/broadcast in the background so commands are served meanwhile
+            initial_check_thread = threading.Thread(target=initial_check)
+            initial_check_thread.daemon = True
+            initial_check_thread.start()
 
+            self.wait_until_ready()
 
             logger.info("Starting main scheduler loop")
             while True:
+                # Schedule regular checks only once the background initial check has finished
+                if initial_check_thread is not None and not initial_check_thread.is_alive():
+                    initial_check_thread = None
+                    schedule_next_check()
                 schedule.run_pending()
                 time.sleep(1)
 